@@ -1,10 +1,13 @@
 from fastapi import FastAPI, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
+import logging
 import os
 import time
 from datetime import datetime
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if it exists
@@ -29,8 +32,15 @@ app = FastAPI(
     title="NBA Player Analysis API",
     description="API for analyzing NBA player performance and game schedules",
     version="0.1.0",
+    # orjson encodes responses several times faster than the stdlib json
+    # encoder and emits bytes directly
+    default_response_class=ORJSONResponse,
 )
 
+# Compress large JSON responses (search results, season comparisons).
+# Responses under 1KB are sent as-is; compresslevel=5 balances CPU vs ratio.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add CORS middleware to allow cross-origin requests (useful for web frontends)
 app.add_middleware(
     CORSMiddleware,
@@ -40,55 +50,127 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Simple in-memory rate limiting
-request_counts = {}
+# Token-bucket rate limiting settings
+# Each client IP gets a bucket of RATE_LIMIT_CAPACITY tokens that refills
+# continuously at RATE_LIMIT_REFILL_RATE tokens per second, so short bursts
+# are allowed but sustained traffic is capped at ~100 requests per minute.
+RATE_LIMIT_CAPACITY = 100
+RATE_LIMIT_REFILL_RATE = RATE_LIMIT_CAPACITY / 60.0
 
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    """Simple rate limiting middleware."""
-    client_ip = request.client.host
-    
-    # Simple in-memory rate limiting (could be replaced with Redis in production)
-    if client_ip in request_counts:
-        if request_counts[client_ip]["count"] > 100 and \
-           time.time() - request_counts[client_ip]["timestamp"] < 60:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return JSONResponse(
-                status_code=429,
-                content={"message": "Too many requests. Please try again later."}
-            )
-        request_counts[client_ip]["count"] += 1
-    else:
-        request_counts[client_ip] = {"count": 1, "timestamp": time.time()}
-    
-    response = await call_next(request)
-    return response
-
-@app.middleware("http")
-async def log_requests_middleware(request: Request, call_next):
-    """Log all incoming requests."""
-    start_time = time.time()
-    path = request.url.path
-    query_params = str(request.query_params)
-    
-    logger.info(f"Request start: {request.method} {path} {query_params}")
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(f"Request completed: {request.method} {path} {response.status_code} ({process_time:.3f}s)")
-    
-    return response
+# Pre-encoded 429 response so rejected requests don't pay for JSON encoding
+_RATE_LIMIT_BODY = b'{"message": "Too many requests. Please try again later."}'
+
+class RateLimitMiddleware:
+    """Pure ASGI token-bucket rate limiting middleware.
+
+    Implemented as a raw ASGI callable rather than @app.middleware("http")
+    because Starlette's BaseHTTPMiddleware spawns an extra task and buffers
+    the response body for every request, which adds noticeable latency.
+    """
+
+    def __init__(self, app, capacity: int = RATE_LIMIT_CAPACITY,
+                 refill_rate: float = RATE_LIMIT_REFILL_RATE):
+        self.app = app
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        # Maps client IP -> [tokens, last_refill_timestamp]. Bounded and
+        # TTL-evicted so a scanner cycling through random source IPs can't
+        # grow this dict without limit. TTLCache expires a fixed interval
+        # after *insertion*, so every request re-assigns its bucket to
+        # refresh the TTL - eviction then only hits entries idle for 2
+        # minutes, which would have refilled to full capacity anyway.
+        self.buckets = TTLCache(maxsize=100_000, ttl=120)
+
+    async def __call__(self, scope, receive, send):
+        # Only rate-limit HTTP requests (not websockets or lifespan events)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        now = time.time()
+
+        # Refill the bucket based on how long it has been since the last
+        # request, then spend one token (or reject if the bucket is empty)
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            self.buckets[client_ip] = [self.capacity - 1, now]
+        else:
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                logger.warning("Rate limit exceeded for IP: %s", client_ip)
+                await send({
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(_RATE_LIMIT_BODY)).encode()),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": _RATE_LIMIT_BODY})
+                return
+            bucket[0] -= 1
+            # Re-insert to push the TTL out; without this an active
+            # client's bucket expires 120s after first sight and hands
+            # it a fresh full-capacity burst
+            self.buckets[client_ip] = bucket
+
+        await self.app(scope, receive, send)
+
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware that logs all incoming requests."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Only log HTTP requests (not websockets or lifespan events)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip all per-request formatting (including the query-string decode)
+        # when INFO is disabled, e.g. in production with log_level=warning
+        if not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+
+        logger.info("Request start: %s %s %s", method, path,
+                    scope.get("query_string", b"").decode("latin-1"))
+
+        status_code = None
+
+        async def send_wrapper(message):
+            # Capture the status code from the response start message
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        process_time = time.perf_counter() - start_time
+        logger.info("Request completed: %s %s %s (%.3fs)", method, path, status_code, process_time)
+
+# Register the ASGI middlewares (outermost first: logging wraps rate limiting)
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(RequestLoggingMiddleware)
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions globally."""
     # Log the error
-    logger.exception(f"Unhandled exception on {request.url}: {str(exc)}")
+    logger.exception("Unhandled exception on %s: %s", request.url, exc)
     
     # Return a user-friendly response
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "message": "An unexpected error occurred",
@@ -116,4 +198,16 @@ async def root():
 # Run the application if this file is executed directly
 if __name__ == "__main__":
     logger.info("Starting NBA Player Analysis API")
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
+    # uvloop/httptools are faster drop-in implementations of the event loop
+    # and HTTP parser; the uvicorn access log duplicates our own request
+    # logging middleware, so it stays off. Set DEV=1 to enable auto-reload.
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+        reload=bool(os.getenv("DEV")),
+    )
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""Disk-backed memoization for expensive comparison results.
+
+The in-process TTLCache in the stats endpoints dies with the worker; a
+season comparison is deterministic given the upstream data and expensive
+to rebuild (fetch + group + vectorized averaging), so completed results
+are also persisted as compact JSON files. A repeat query after a restart
+is served straight from disk instead of re-running the whole pipeline.
+
+Entries are keyed by a digest of (player_id, sorted seasons) and expire
+by file mtime, so invalidation needs no index - a stale file is simply
+recomputed and overwritten.
+"""
+
+import os
+import time
+from hashlib import blake2b
+from typing import Any, Callable, List, Optional
+
+from nba_api.logger import get_logger
+from nba_api.utils import load_from_json, save_to_json
+
+logger = get_logger(__name__)
+
+# Comparisons can shift mid-season as new games land; a day-old entry is
+# close enough for a result that otherwise costs a full upstream fetch
+_TTL_SECONDS = 86_400
+
+_CACHE_DIR = os.path.join("data", "comparisons")
+
+def _comparison_path(player_id: int, seasons: List[int]) -> str:
+    key = f"{player_id}:{','.join(map(str, sorted(seasons)))}"
+    digest = blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{digest}.json")
+
+def cached_comparison(compute: Callable[[], Any], player_id: int,
+                      seasons: List[int]) -> Any:
+    """Serve a comparison from disk, computing and persisting on miss.
+
+    Args:
+        compute: Zero-argument callable that builds the comparison
+        player_id: The player the comparison is for
+        seasons: Seasons included (order-insensitive)
+
+    Returns:
+        The cached or freshly computed comparison dict
+    """
+    path = _comparison_path(player_id, seasons)
+
+    try:
+        fresh = (time.time() - os.path.getmtime(path)) < _TTL_SECONDS
+    except OSError:
+        fresh = None
+
+    if fresh:
+        try:
+            return load_from_json(path)
+        except (OSError, ValueError):
+            logger.warning("Unreadable comparison cache entry %s; recomputing", path)
+
+    result = compute()
+
+    # Persisting is best-effort - a failed write just means the next
+    # request recomputes
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        save_to_json(result, path, verbose=False)
+    except OSError as e:
+        logger.warning("Failed to persist comparison cache entry: %s", e)
+
+    return result
@@ -0,0 +1,49 @@
+"""ctypes loader for the optional C growth kernel.
+
+growth.c next to this file compiles to growth.so (build command in its
+header comment). When the shared object is present it is loaded once at
+import and ``growth_pct_f32`` becomes a thin ctypes wrapper; when it is
+missing ``growth_pct_f32`` is None and callers fall back to NumPy, the
+same pattern as the other optional accelerators.
+"""
+
+import ctypes
+import os
+
+import numpy as np
+
+_LIB_PATH = os.path.join(os.path.dirname(__file__), 'growth.so')
+
+try:
+    _lib = ctypes.CDLL(_LIB_PATH)
+    _lib.growth_pct_f32.restype = None
+    _lib.growth_pct_f32.argtypes = [
+        ctypes.POINTER(ctypes.c_float),
+        ctypes.POINTER(ctypes.c_float),
+        ctypes.POINTER(ctypes.c_float),
+        ctypes.c_int,
+    ]
+except OSError:
+    _lib = None
+
+if _lib is not None:
+    _FLOAT_P = ctypes.POINTER(ctypes.c_float)
+
+    def growth_pct_f32(prev: np.ndarray, curr: np.ndarray) -> np.ndarray:
+        """Percent change between two float vectors via the C kernel.
+
+        Inputs are coerced to contiguous float32; zero baselines come
+        out as NaN, matching the NumPy path.
+        """
+        prev = np.ascontiguousarray(prev, dtype=np.float32)
+        curr = np.ascontiguousarray(curr, dtype=np.float32)
+        out = np.empty_like(prev)
+        _lib.growth_pct_f32(
+            prev.ctypes.data_as(_FLOAT_P),
+            curr.ctypes.data_as(_FLOAT_P),
+            out.ctypes.data_as(_FLOAT_P),
+            prev.shape[0],
+        )
+        return out
+else:
+    growth_pct_f32 = None
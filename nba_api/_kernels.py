@@ -0,0 +1,48 @@
+"""JIT-compiled numeric kernels for batch stat recomputation.
+
+Hot trend endpoints recompute growth percentages across every player and
+season pair (N x S x 8 ops); at that scale even NumPy's per-call overhead
+shows up. The kernels here are compiled with numba to a parallel native
+loop - the first call pays the JIT cost (cached on disk with cache=True),
+every call after runs at native speed. When numba is not installed the
+module falls back to an equivalent NumPy implementation, so callers never
+need to care which path they got.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit
+except ImportError:
+    numba = None
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _growth_pct(prev, curr, out):
+        for i in numba.prange(prev.shape[0]):
+            for j in range(prev.shape[1]):
+                p = prev[i, j]
+                if p != 0.0:
+                    out[i, j] = (curr[i, j] - p) / abs(p) * 100.0
+                else:
+                    out[i, j] = np.nan
+else:
+    def _growth_pct(prev, curr, out):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.copyto(out, np.where(prev != 0, (curr - prev) / np.abs(prev) * 100.0, np.nan))
+
+def compute_growth_batch(prev2d: np.ndarray, curr2d: np.ndarray) -> np.ndarray:
+    """Percent change between two (rows, metrics) matrices.
+
+    ``prev2d`` and ``curr2d`` must share shape; rows are player/season
+    pairs and columns are metrics. The output is allocated once and the
+    whole batch is filled in a single kernel call. Zero baselines come
+    out as NaN, matching the per-pair compare path.
+    """
+    prev2d = np.ascontiguousarray(prev2d, dtype=np.float64)
+    curr2d = np.ascontiguousarray(curr2d, dtype=np.float64)
+    out = np.empty_like(prev2d)
+    _growth_pct(prev2d, curr2d, out)
+    return out
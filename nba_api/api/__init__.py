@@ -1,5 +1,17 @@
-from .endpoints.players import router as players_router
-from .endpoints.calendar import router as calendar_router
-from .endpoints.stats import router as stats_router
+# Routers are re-exported lazily (PEP 562) so that importing nba_api.api
+# does not pull in every endpoint module - and with them the BallDontLie
+# client, the Google Calendar stack, etc. - unless a router is actually used.
 
-__all__ = ["players_router", "calendar_router", "stats_router"]
\ No newline at end of file
+__all__ = ["players_router", "calendar_router", "stats_router"]
+
+def __getattr__(name):
+    if name == "players_router":
+        from .endpoints.players import router
+        return router
+    if name == "calendar_router":
+        from .endpoints.calendar import router
+        return router
+    if name == "stats_router":
+        from .endpoints.stats import router
+        return router
+    raise AttributeError(name)
@@ -0,0 +1,25 @@
+from functools import lru_cache
+from fastapi import HTTPException
+from nba_api.client import BallDontLieClient
+import os
+
+# Read the API key once at import time; it doesn't change while the server
+# is running, so there's no need for an environment lookup per request
+_API_KEY = os.environ.get("BALLDONTLIE_API_KEY")
+
+@lru_cache(maxsize=1)
+def _build_client(api_key: str) -> BallDontLieClient:
+    """Build the BallDontLie client once and reuse it across requests."""
+    return BallDontLieClient(api_key)
+
+def get_client():
+    """Dependency to get the shared BallDontLie API client instance.
+
+    This is the single get_client used by every router. Sharing one
+    dependency object (instead of one copy per module) also lets FastAPI's
+    per-request dependency cache reuse the result across routers.
+    """
+    api_key = _API_KEY or os.environ.get("BALLDONTLIE_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=500, detail="API key not configured")
+    return _build_client(api_key)
@@ -1,5 +1,16 @@
-from .players import router as players_router
-from .calendar import router as calendar_router
-from .stats import router as stats_router
+# Routers are re-exported lazily (PEP 562) so that importing the package
+# does not eagerly import every endpoint module and its dependencies.
 
-__all__ = ["players_router", "calendar_router", "stats_router"]
\ No newline at end of file
+__all__ = ["players_router", "calendar_router", "stats_router"]
+
+def __getattr__(name):
+    if name == "players_router":
+        from .players import router
+        return router
+    if name == "calendar_router":
+        from .calendar import router
+        return router
+    if name == "stats_router":
+        from .stats import router
+        return router
+    raise AttributeError(name)
@@ -3,8 +3,9 @@ from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
 from nba_api.client import BallDontLieClient
 from nba_api.calendar_service import GoogleCalendarService
 from nba_api.models.calendar import GameEvent, CalendarEventResponse, CalendarAuthStatusResponse
-import os
-from datetime import datetime
+from nba_api.api.deps import get_client
+from fastapi.concurrency import run_in_threadpool
+from datetime import date
 
 router = APIRouter(
     prefix="/calendar",
@@ -12,22 +13,42 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Cache of today's date string, recomputed only when the day changes -
+# strftime is surprisingly heavy for something that changes once a day
+_today_cache = {"ordinal": None, "value": ""}
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, cached per day."""
+    ordinal = date.today().toordinal()
+    if _today_cache["ordinal"] != ordinal:
+        _today_cache["ordinal"] = ordinal
+        _today_cache["value"] = date.fromordinal(ordinal).isoformat()
+    return _today_cache["value"]
+
+# Shared service instance - kept only once authentication has succeeded
+_calendar_service: Optional[GoogleCalendarService] = None
+
 # Dependency to get the calendar service
 def get_calendar_service():
-    """Get an instance of the Google Calendar service."""
-    service = GoogleCalendarService()
-    return service
+    """Get the shared Google Calendar service instance.
 
-# Dependency to get the BallDontLie client
-def get_client():
-    """Get an instance of the BallDontLie API client."""
-    api_key = os.environ.get("BALLDONTLIE_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="API key not configured")
-    return BallDontLieClient(api_key)
+    Building the service reads token.json and fetches the Calendar API
+    discovery document, so an authenticated instance is built once per
+    process and reused. An instance whose auth failed is returned but
+    not cached - dropping a valid token.json in place then recovers on
+    the next request instead of pinning every endpoint at 401.
+    Credential refresh is handled inside the service.
+    """
+    global _calendar_service
+    if _calendar_service is None:
+        service = GoogleCalendarService()
+        if not service.is_authenticated():
+            return service
+        _calendar_service = service
+    return _calendar_service
 
 @router.get("/auth-status", response_model=CalendarAuthStatusResponse)
-def get_auth_status(calendar_service: GoogleCalendarService = Depends(get_calendar_service)):
+async def get_auth_status(calendar_service: GoogleCalendarService = Depends(get_calendar_service)):
     """Check if the calendar service is authenticated."""
     is_authenticated = calendar_service.is_authenticated()
     
@@ -37,7 +58,7 @@ def get_auth_status(calendar_service: GoogleCalendarService = Depends(get_calend
     }
 
 @router.get("/upcoming-events", response_model=List[dict])
-def get_upcoming_events(
+async def get_upcoming_events(
     max_results: int = Query(10, description="Maximum number of events to return"),
     calendar_service: GoogleCalendarService = Depends(get_calendar_service)
 ):
@@ -45,11 +66,11 @@ def get_upcoming_events(
     if not calendar_service.is_authenticated():
         raise HTTPException(status_code=401, detail="Calendar service not authenticated")
     
-    events = calendar_service.list_upcoming_events(max_results)
+    events = await run_in_threadpool(calendar_service.list_upcoming_events, max_results)
     return events
 
 @router.post("/add-game", response_model=CalendarEventResponse)
-def add_game_to_calendar(
+async def add_game_to_calendar(
     game_event: GameEvent,
     calendar_service: GoogleCalendarService = Depends(get_calendar_service)
 ):
@@ -57,11 +78,12 @@ def add_game_to_calendar(
     if not calendar_service.is_authenticated():
         raise HTTPException(status_code=401, detail="Calendar service not authenticated")
     
-    # Convert Pydantic model to dictionary
-    event_data = game_event.dict()
+    # Convert Pydantic model to dictionary (model_dump is the pydantic v2
+    # API and runs in pydantic-core instead of a Python-level walk)
+    event_data = game_event.model_dump()
     
     # Add the event to calendar
-    result = calendar_service.add_event(event_data)
+    result = await run_in_threadpool(calendar_service.add_event, event_data)
     
     if not result:
         raise HTTPException(status_code=500, detail="Failed to create calendar event")
@@ -69,7 +91,7 @@ def add_game_to_calendar(
     return result
 
 @router.post("/add-team-games", response_model=List[CalendarEventResponse])
-def add_team_games_to_calendar(
+async def add_team_games_to_calendar(
     team_id: int = Query(..., description="Team ID"),
     max_games: int = Query(5, description="Maximum number of games to add"),
     client: BallDontLieClient = Depends(get_client),
@@ -80,29 +102,21 @@ def add_team_games_to_calendar(
         raise HTTPException(status_code=401, detail="Calendar service not authenticated")
     
     # Get today's date
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = _today_str()
     
     # Get upcoming games for the team
-    games = client.get_team_games(team_id, start_date=today)
+    games = await run_in_threadpool(client.get_team_games, team_id, start_date=today)
     
     if not games:
         raise HTTPException(status_code=404, detail=f"No upcoming games found for team ID {team_id}")
     
     # Limit to max_games
     games = games[:max_games]
-    
-    # Add each game to calendar
-    results = []
-    for game in games:
-        # Format game for calendar
-        event_data = client.format_game_for_calendar(game)
-        
-        # Add to calendar
-        result = calendar_service.add_event(event_data)
-        
-        if result:
-            results.append(result)
-    
+
+    # Format the games and add them to the calendar in one batched request
+    event_datas = [client.format_game_for_calendar(game) for game in games]
+    results = await run_in_threadpool(calendar_service.add_events_batch, event_datas)
+
     if not results:
         raise HTTPException(status_code=500, detail="Failed to add any games to calendar")
     
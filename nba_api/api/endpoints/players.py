@@ -1,8 +1,22 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from fastapi.concurrency import run_in_threadpool
+from nba_api.api.deps import get_client
 from nba_api.client import BallDontLieClient
-from nba_api.models.player import Player, PlayerWithStats, SearchResponse, PlayerStat
-import os
+from nba_api.models.player import Player, PlayerWithStats, PlayerStat
+
+# In-process response caches: search results change rarely within a few
+# minutes, and player bio details change at most once per day.
+_search_cache = TTLCache(maxsize=10_000, ttl=300)
+_player_cache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Defaults for the PlayerStat fields extracted from a raw stat entry,
+# kept at module level so each request reuses the same key set
+_STAT_DEFAULTS = {
+    'pts': 0, 'reb': 0, 'ast': 0, 'stl': 0, 'blk': 0,
+    'fg_pct': 0, 'fg3_pct': 0, 'ft_pct': 0, 'turnover': 0, 'min': '0'
+}
 
 router = APIRouter(
     prefix="/players",
@@ -10,50 +24,60 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-def get_client():
-    """Dependency to get a BallDontLie API client instance."""
-    api_key = os.environ.get("BALLDONTLIE_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="API key not configured")
-    return BallDontLieClient(api_key)
-
-@router.get("/search/", response_model=SearchResponse)
-def search_players(
+@router.get("/search/")
+async def search_players(
+    response: Response,
     name: str = Query(..., description="Name to search for"),
     client: BallDontLieClient = Depends(get_client)
 ):
     """
     Search for players by name.
-    
+
     This endpoint searches for NBA players whose names match the provided search term.
-    Results are returned in order of relevance.
+    Results are returned in order of relevance, in the shape of the
+    SearchResponse model ({"count": ..., "results": [...]}).
+
+    The player dictionaries come straight from our own client, so they are
+    returned as-is instead of being re-validated through Pydantic models -
+    for a search returning dozens of players, that validation pass was the
+    dominant cost of the endpoint.
     """
-    players = client.search_players(name)
-    
-    # Convert to Pydantic models
-    player_models = [Player(**player) for player in players]
-    
+    response.headers["Cache-Control"] = "max-age=300"
+
+    cache_key = name.lower().strip()
+    players = _search_cache.get(cache_key)
+    if players is None:
+        players = await run_in_threadpool(client.search_players, name)
+        _search_cache[cache_key] = players
+
     return {
-        "count": len(player_models),
-        "results": player_models
+        "count": len(players),
+        "results": players
     }
 
 @router.get("/{player_id}", response_model=Player)
-def get_player(
+async def get_player(
     player_id: int,
+    response: Response,
     client: BallDontLieClient = Depends(get_client)
 ):
     """
     Get detailed information about a specific player by ID.
     """
-    player = client.get_player(player_id)
+    response.headers["Cache-Control"] = "max-age=3600"
+
+    player = _player_cache.get(player_id)
+    if player is None:
+        player = await run_in_threadpool(client.get_player, player_id)
+        _player_cache[player_id] = player
     if not player:
         raise HTTPException(status_code=404, detail=f"Player with ID {player_id} not found")
-    
-    return Player(**player)
+
+    # The client already returns a validated Player model
+    return player
 
 @router.get("/{player_id}/stats", response_model=PlayerWithStats)
-def get_player_stats(
+async def get_player_stats(
     player_id: int,
     season: Optional[int] = Query(None, description="Season year (e.g., 2023 for 2023-2024)"),
     client: BallDontLieClient = Depends(get_client)
@@ -64,36 +88,26 @@ def get_player_stats(
     If no season is specified, the most recent available statistics will be returned.
     """
     # Get player details
-    player = client.get_player(player_id)
+    player = await run_in_threadpool(client.get_player, player_id)
     if not player:
         raise HTTPException(status_code=404, detail=f"Player with ID {player_id} not found")
     
     # Get player stats
-    stats = client.get_player_stats(player_id, season)
+    stats = await run_in_threadpool(client.get_player_stats, player_id, season)
     
     # Check if stats were found
     if not stats:
-        player_model = Player(**player)
-        return PlayerWithStats(**player_model.dict(), stats=None)
+        return PlayerWithStats(**player.model_dump(), stats=None)
     
     # Get the first stat entry (could be improved to aggregate or get the most relevant)
     stat_data = stats[0]
     
-    # Create the PlayerStat model
-    player_stat = PlayerStat(
-        pts=stat_data.get('pts', 0),
-        reb=stat_data.get('reb', 0),
-        ast=stat_data.get('ast', 0),
-        stl=stat_data.get('stl', 0),
-        blk=stat_data.get('blk', 0),
-        fg_pct=stat_data.get('fg_pct', 0),
-        fg3_pct=stat_data.get('fg3_pct', 0),
-        ft_pct=stat_data.get('ft_pct', 0),
-        turnover=stat_data.get('turnover', 0),
-        min=stat_data.get('min', '0'),
-        season=season
-    )
-    
+    # Create the PlayerStat model - merge the defaults with whatever fields
+    # the stat entry actually has, and skip validation since the data comes
+    # from our own client
+    merged = {**_STAT_DEFAULTS, **{k: stat_data[k] for k in _STAT_DEFAULTS.keys() & stat_data.keys()}}
+    merged['season'] = season
+    player_stat = PlayerStat.model_construct(**merged)
+
     # Create the complete player with stats
-    player_model = Player(**player)
-    return PlayerWithStats(**player_model.dict(), stats=player_stat)
\ No newline at end of file
+    return PlayerWithStats(**player.model_dump(), stats=player_stat)
\ No newline at end of file
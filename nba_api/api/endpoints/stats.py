@@ -1,5 +1,8 @@
+from functools import partial
 from typing import List, Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Query, Depends, Path
+from nba_api._cache import cached_comparison
 from nba_api.client import BallDontLieClient
 from nba_api.models.stats import StatisticsComparison, StatisticsRequest
 from nba_api.exceptions import (
@@ -7,11 +10,17 @@ from nba_api.exceptions import (
     SeasonNotFoundError, ApiRateLimitError, InvalidParameterError
 )
 from nba_api.logger import get_logger
-import os
+from nba_api.api.deps import get_client
+from fastapi.concurrency import run_in_threadpool
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# In-process response caches: season lists only change when a new season
+# starts, while comparisons can shift mid-season as new games are played.
+_seasons_cache = TTLCache(maxsize=10_000, ttl=3600)
+_compare_cache = TTLCache(maxsize=10_000, ttl=600)
+
 router = APIRouter(
     prefix="/stats",
     tags=["statistics"],
@@ -24,16 +33,8 @@ router = APIRouter(
     },
 )
 
-def get_client():
-    """Dependency to get a BallDontLie API client instance."""
-    api_key = os.environ.get("BALLDONTLIE_API_KEY")
-    if not api_key:
-        logger.error("API key not configured in environment variables")
-        raise HTTPException(status_code=500, detail="API key not configured")
-    return BallDontLieClient(api_key)
-
 @router.get("/player/{player_id}/seasons", response_model=List[int])
-def get_player_seasons(
+async def get_player_seasons(
     player_id: int = Path(..., description="Player ID"),
     client: BallDontLieClient = Depends(get_client)
 ):
@@ -55,7 +56,10 @@ def get_player_seasons(
     logger.info(f"API request: Get seasons for player {player_id}")
     
     try:
-        seasons = client.get_player_seasons(player_id)
+        seasons = _seasons_cache.get(player_id)
+        if seasons is None:
+            seasons = await run_in_threadpool(client.get_player_seasons, player_id)
+            _seasons_cache[player_id] = seasons
         
         if not seasons:
             logger.warning(f"No seasons found for player {player_id}")
@@ -86,7 +90,7 @@ def get_player_seasons(
         )
 
 @router.get("/player/{player_id}/compare", response_model=StatisticsComparison)
-def compare_seasons_get(
+async def compare_seasons_get(
     player_id: int = Path(..., description="Player ID"),
     seasons: List[int] = Query(..., description="Seasons to compare"),
     client: BallDontLieClient = Depends(get_client)
@@ -116,7 +120,18 @@ def compare_seasons_get(
                 detail="At least one season must be specified"
             )
         
-        result = client.compare_player_seasons(player_id, seasons)
+        # Canonicalize: duplicates would trigger redundant upstream fetches,
+        # and sorting makes equivalent requests share one cache entry
+        seasons = sorted(set(seasons))
+
+        cache_key = (player_id, tuple(seasons))
+        result = _compare_cache.get(cache_key)
+        if result is None:
+            # Disk-backed layer under the in-process cache: survives worker
+            # restarts and only recomputes on a genuine miss
+            compute = partial(client.compare_player_seasons, player_id, seasons)
+            result = await run_in_threadpool(cached_comparison, compute, player_id, seasons)
+            _compare_cache[cache_key] = result
         return result
         
     except PlayerNotFoundError as e:
@@ -142,7 +157,7 @@ def compare_seasons_get(
         )
 
 @router.post("/player/{player_id}/compare", response_model=StatisticsComparison)
-def compare_seasons_post(
+async def compare_seasons_post(
     player_id: int = Path(..., description="Player ID"),
     request: StatisticsRequest = ...,
     client: BallDontLieClient = Depends(get_client)
@@ -171,7 +186,18 @@ def compare_seasons_post(
                 detail="At least one season must be specified"
             )
         
-        result = client.compare_player_seasons(player_id, request.seasons)
+        # Canonicalize: duplicates would trigger redundant upstream fetches,
+        # and sorting makes equivalent requests share one cache entry
+        seasons = sorted(set(request.seasons))
+
+        cache_key = (player_id, tuple(seasons))
+        result = _compare_cache.get(cache_key)
+        if result is None:
+            # Disk-backed layer under the in-process cache: survives worker
+            # restarts and only recomputes on a genuine miss
+            compute = partial(client.compare_player_seasons, player_id, seasons)
+            result = await run_in_threadpool(cached_comparison, compute, player_id, seasons)
+            _compare_cache[cache_key] = result
         return result
         
     except PlayerNotFoundError as e:
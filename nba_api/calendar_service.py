@@ -1,6 +1,7 @@
 import os
-import json
 import datetime
+import orjson
+from pathlib import Path
 from typing import Dict, List, Optional, Union
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -11,6 +12,18 @@ import dateutil.parser
 # Define the scopes (permissions) required for Google Calendar
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+def _parse_dt(value: str) -> datetime.datetime:
+    """Parse a datetime string, taking the C fast path for ISO-8601 input.
+
+    Our event datetimes are always ISO-8601 strings, for which
+    datetime.fromisoformat is orders of magnitude faster than dateutil's
+    generic parser; dateutil remains the fallback for anything else.
+    """
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return dateutil.parser.parse(value)
+
 class GoogleCalendarService:
     """Service for interacting with Google Calendar API.
     
@@ -27,6 +40,10 @@ class GoogleCalendarService:
         """
         self.credentials_path = credentials_path
         self.token_path = token_path
+        # Cache the loaded credentials along with the token file's mtime so
+        # repeated calls only re-read token.json when it changed on disk
+        self._cached_creds = None
+        self._cached_token_mtime = None
         self.credentials = self._get_credentials()
         
         if self.credentials:
@@ -46,14 +63,26 @@ class GoogleCalendarService:
             Credentials object or None if authorization fails
         """
         creds = None
-        
-        # Check if token.json exists with cached credentials
-        if os.path.exists(self.token_path):
+
+        # Check for cached credentials in token.json. EAFP: ask for the mtime
+        # directly and treat a miss as "no token" rather than paying a
+        # separate exists() stat on every call.
+        try:
+            token_mtime = os.path.getmtime(self.token_path)
+        except OSError:
+            token_mtime = None
+
+        if token_mtime is not None:
+            # Reuse the in-memory credentials unless the file changed on disk
+            if self._cached_creds is not None and token_mtime == self._cached_token_mtime:
+                return self._cached_creds
+
             try:
-                creds = Credentials.from_authorized_user_info(
-                    json.loads(open(self.token_path).read()),
-                    SCOPES
-                )
+                # Read the whole file in one go; orjson decodes the raw
+                # bytes directly (no dangling file handle, no str decode)
+                token_data = orjson.loads(Path(self.token_path).read_bytes())
+                creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+                self._cached_token_mtime = token_mtime
             except Exception as e:
                 print(f"Error loading cached credentials: {e}")
         
@@ -77,10 +106,15 @@ class GoogleCalendarService:
                     print(f"Error in authentication flow: {e}")
                     return None
                 
-            # Save the credentials for future runs
-            with open(self.token_path, 'w') as token:
-                token.write(creds.to_json())
-        
+            # Save the credentials for future runs. Write to a temp file and
+            # os.replace it into place - the rename is atomic within a
+            # filesystem, so a reader never sees a half-written token file.
+            tmp_path = f"{self.token_path}.tmp.{os.getpid()}"
+            Path(tmp_path).write_bytes(creds.to_json().encode())
+            os.replace(tmp_path, self.token_path)
+            self._cached_token_mtime = os.path.getmtime(self.token_path)
+
+        self._cached_creds = creds
         return creds
     
     def is_authenticated(self) -> bool:
@@ -91,46 +125,56 @@ class GoogleCalendarService:
         """
         return self.service is not None
     
+    def _build_event_body(self, event_data: Dict) -> Dict:
+        """Build the Google Calendar event body from our event data.
+
+        Args:
+            event_data: Dictionary with event details
+
+        Returns:
+            Event body dictionary in the format the Calendar API expects
+        """
+        # Parse start and end times
+        start_datetime = _parse_dt(event_data['start_datetime'])
+        end_datetime = _parse_dt(event_data['end_datetime'])
+
+        return {
+            'summary': event_data['summary'],
+            'location': event_data.get('location', ''),
+            'description': event_data.get('description', ''),
+            'start': {
+                'dateTime': start_datetime.isoformat(),
+                'timeZone': 'America/New_York',  # Default timezone, could be parameterized
+            },
+            'end': {
+                'dateTime': end_datetime.isoformat(),
+                'timeZone': 'America/New_York',  # Default timezone, could be parameterized
+            },
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1 day before
+                    {'method': 'popup', 'minutes': 90},       # 1.5 hours before
+                ],
+            },
+        }
+
     def add_event(self, event_data: Dict) -> Optional[Dict]:
         """Add an event to Google Calendar.
-        
+
         Args:
             event_data: Dictionary with event details
-            
+
         Returns:
             Created event data or None if operation fails
         """
         if not self.is_authenticated():
             print("Error: Calendar service not authenticated")
             return None
-        
+
         try:
-            # Parse start and end times
-            start_datetime = dateutil.parser.parse(event_data['start_datetime'])
-            end_datetime = dateutil.parser.parse(event_data['end_datetime'])
-            
-            # Create Google Calendar event
-            event = {
-                'summary': event_data['summary'],
-                'location': event_data.get('location', ''),
-                'description': event_data.get('description', ''),
-                'start': {
-                    'dateTime': start_datetime.isoformat(),
-                    'timeZone': 'America/New_York',  # Default timezone, could be parameterized
-                },
-                'end': {
-                    'dateTime': end_datetime.isoformat(),
-                    'timeZone': 'America/New_York',  # Default timezone, could be parameterized
-                },
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},  # 1 day before
-                        {'method': 'popup', 'minutes': 90},       # 1.5 hours before
-                    ],
-                },
-            }
-            
+            event = self._build_event_body(event_data)
+
             # Insert the event
             created_event = self.service.events().insert(calendarId='primary', body=event).execute()
             return {
@@ -138,11 +182,55 @@ class GoogleCalendarService:
                 'htmlLink': created_event.get('htmlLink'),
                 'status': 'created'
             }
-        
+
         except Exception as e:
             print(f"Error creating calendar event: {e}")
             return None
 
+    def add_events_batch(self, event_data_list: List[Dict]) -> List[Dict]:
+        """Add several events to Google Calendar in a single HTTP request.
+
+        Each insert in a plain loop costs a full HTTPS round-trip to Google;
+        a batch request sends all inserts at once, so total latency is that
+        of one round-trip instead of one per event.
+
+        Args:
+            event_data_list: List of dictionaries with event details
+
+        Returns:
+            List of created event data (failed inserts are skipped)
+        """
+        if not self.is_authenticated():
+            print("Error: Calendar service not authenticated")
+            return []
+
+        results = []
+
+        def _collect(request_id, response, exception):
+            # Callback invoked once per insert in the batch
+            if exception is not None:
+                print(f"Error creating calendar event: {exception}")
+                return
+            results.append({
+                'id': response.get('id'),
+                'htmlLink': response.get('htmlLink'),
+                'status': 'created'
+            })
+
+        try:
+            batch = self.service.new_batch_http_request()
+            for event_data in event_data_list:
+                event = self._build_event_body(event_data)
+                batch.add(
+                    self.service.events().insert(calendarId='primary', body=event),
+                    callback=_collect
+                )
+            batch.execute()
+        except Exception as e:
+            print(f"Error executing calendar batch request: {e}")
+
+        return results
+
     def list_upcoming_events(self, max_results: int = 10) -> List[Dict]:
         """List upcoming events on the user's calendar.
         
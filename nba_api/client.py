@@ -1,9 +1,20 @@
 import os
 import json
+import hashlib
+import sqlite3
+import numpy as np
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime
+from urllib.parse import urlencode
+from pydantic import BaseModel, ValidationError
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 # Import custom exceptions and logger
 from nba_api.exceptions import (
@@ -11,10 +22,92 @@ from nba_api.exceptions import (
     SeasonNotFoundError, ApiRateLimitError, InvalidParameterError, CacheError
 )
 from nba_api.logger import get_logger
+from nba_api.models.player import Player
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+class _PlayerEnvelope(BaseModel):
+    """Envelope for single-player responses ({"data": {...}})."""
+    data: Optional[Player] = None
+
+# Prefer orjson for cache (de)serialization - it parses and serializes
+# several times faster than stdlib json - but fall back to the stdlib so
+# the client still works on installs without the extension.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(data):
+        return orjson.dumps(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(data):
+        return json.dumps(data).encode()
+
+# Stat columns averaged per season and the subset reported in growth
+# comparisons - frozen at module level so they're shared across calls
+# rather than rebuilt per invocation
+_STAT_KEYS = ("pts", "reb", "ast", "stl", "blk",
+              "turnover", "fg_pct", "fg3_pct", "ft_pct")
+_GROWTH_METRICS = ("pts", "reb", "ast", "stl", "blk",
+                   "fg_pct", "fg3_pct", "ft_pct")
+
+# Entry cap for the per-client in-memory response cache
+_MEM_CACHE_SIZE = 256
+
+@lru_cache(maxsize=64)
+def _endpoint_url(base_url: str, endpoint: str) -> str:
+    """Memoized full URL for an endpoint.
+
+    The set of endpoints is tiny (players, stats, games, players/{id}), so
+    after warm-up the hot path reuses interned URL strings instead of
+    re-running the f-string per request.
+    """
+    return f"{base_url}/{endpoint}"
+
+
+@lru_cache(maxsize=1024)
+def _cache_key_for(endpoint: str, params_key: tuple) -> bytes:
+    """Memoized cache-key digest for an (endpoint, sorted-params) pair.
+
+    The same endpoint/params combinations recur constantly within a session
+    (e.g. get_player_seasons hitting /stats), so repeat derivations become a
+    single dict lookup instead of an urlencode + BLAKE2b hash.
+    """
+    raw = f"{endpoint}?{urlencode(params_key)}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+def _stat_value(value) -> float:
+    """Coerce a raw stat value to float, mapping missing/bad values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+@lru_cache(maxsize=4096)
+def _parse_minutes(min_str) -> float:
+    """Parse a minutes value like "34:56" (or a plain number) to float minutes.
+
+    Uses str.partition instead of split (fixed 3-tuple, no list allocation)
+    and memoizes the result - minute strings repeat heavily across games, so
+    most calls collapse into a single dict lookup.
+    """
+    try:
+        minutes, sep, seconds = min_str.partition(":")
+        if sep:
+            return int(minutes) + int(seconds) * (1 / 60)
+        return float(min_str)
+    except (TypeError, ValueError, AttributeError):
+        return float("nan")
+
+
 class BallDontLieClient:
     """Client for interacting with the BallDontLie NBA API.
     
@@ -42,34 +135,98 @@ class BallDontLieClient:
         self.base_url = "https://api.balldontlie.io/v1"
         self.headers = {"Authorization": api_key}
         self.cache_dir = cache_dir
-        
+
+        # Use one Session with a sized connection pool so repeated calls
+        # (e.g. one per season in compare_player_seasons) reuse a single
+        # keep-alive TCP+TLS connection instead of re-handshaking each time.
+        # Transient upstream errors are retried with a short backoff. 429
+        # is deliberately not in the forcelist: retrying would hammer an
+        # already-throttled API and urllib3 would raise RetryError before
+        # _check_status could map the response to ApiRateLimitError.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+        self._session.mount('https://', adapter)
+        self._session.headers.update(self.headers)
+
         # Create cache directory if it doesn't exist
         try:
             os.makedirs(cache_dir, exist_ok=True)
-            logger.info(f"Cache directory: {os.path.abspath(cache_dir)}")
+            logger.info("Cache directory: %s", os.path.abspath(cache_dir))
         except OSError as e:
-            logger.error(f"Failed to create cache directory: {str(e)}")
+            logger.error("Failed to create cache directory: %s", e)
             raise CacheError(f"Failed to create cache directory: {str(e)}") from e
-    
-    def _get_cache_path(self, endpoint: str, params: Dict = None) -> str:
-        """Generate a cache file path based on the endpoint and parameters.
-        
+
+        # All cached responses live in one SQLite key-value table instead of
+        # one JSON file per request. A single long-lived connection amortizes
+        # open/close, and a primary-key lookup replaces the stat()+open()
+        # filesystem-metadata cost that dominates small-file reads. WAL mode
+        # keeps reads from the executor threads from blocking on writes.
+        try:
+            self._db = sqlite3.connect(
+                os.path.join(cache_dir, 'cache.sqlite'),
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS cache(k BLOB PRIMARY KEY, v BLOB)')
+        except sqlite3.Error as e:
+            logger.error("Failed to open cache database: %s", e)
+            raise CacheError(f"Failed to open cache database: {str(e)}") from e
+
+        # Small in-process LRU in front of the disk cache: a repeat request
+        # in the same process returns the already-parsed dict without
+        # touching SQLite or re-parsing JSON. All endpoints are idempotent
+        # GETs, so everything is safe to keep.
+        self._mem = OrderedDict()
+
+    def _cache_key(self, endpoint: str, params: Dict = None) -> bytes:
+        """Derive a fixed-size cache key for a request.
+
         Args:
             endpoint: API endpoint
             params: Query parameters
-            
+
         Returns:
-            Path to the cache file
+            16-byte BLAKE2b digest of the endpoint and sorted parameters
         """
-        # Create a unique cache filename based on the request
-        if params:
-            # Convert params to a sorted string representation for consistency
-            param_str = '_'.join(f"{k}_{v}" for k, v in sorted(params.items()))
-            filename = f"{endpoint.replace('/', '_')}_{param_str}.json"
-        else:
-            filename = f"{endpoint.replace('/', '_')}.json"
-        
-        return os.path.join(self.cache_dir, filename)
+        # Sort the params so logically identical requests hash identically;
+        # the tuple form is hashable, which lets the digest be memoized
+        return _cache_key_for(endpoint, tuple(sorted((params or {}).items())))
+
+    def _remember(self, cache_key: bytes, data: Dict) -> None:
+        """Insert a parsed response into the in-memory LRU, evicting the
+        least recently used entry once the cap is reached."""
+        self._mem[cache_key] = data
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > _MEM_CACHE_SIZE:
+            self._mem.popitem(last=False)
+
+    def _check_status(self, response) -> None:
+        """Raise the appropriate exception for a non-200 API response.
+
+        Raises:
+            ApiKeyError: If the API key is invalid or missing.
+            ApiRateLimitError: If the API rate limit has been reached.
+            RequestException: If the API request fails for other reasons.
+        """
+        if response.status_code == 401:
+            logger.error("API key error: %s", response.text)
+            raise ApiKeyError("Invalid or missing API key")
+        elif response.status_code == 429:
+            logger.error("API rate limit exceeded")
+            raise ApiRateLimitError("Rate limit exceeded. Please try again later.")
+        elif response.status_code != 200:
+            logger.error("API request failed: %s - %s", response.status_code, response.text)
+            raise RequestException(f"API request failed with status {response.status_code}: {response.text}")
     
     def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make a request to the API with caching.
@@ -87,60 +244,117 @@ class BallDontLieClient:
             RequestException: If the API request fails for other reasons.
             CacheError: If there's an issue with the cache.
         """
-        # Build the full URL
-        url = f"{self.base_url}/{endpoint}"
-        logger.debug(f"Request: {url}, Params: {params}")
+        # Build the full URL (memoized per endpoint)
+        url = _endpoint_url(self.base_url, endpoint)
+        logger.debug("Request: %s, Params: %s", url, params)
         
-        # Get cache file path
         try:
-            cache_path = self._get_cache_path(endpoint, params)
-            
-            # Check if response is already cached
-            if os.path.exists(cache_path):
-                logger.debug(f"Using cached response from {cache_path}")
+            cache_key = self._cache_key(endpoint, params)
+
+            # Memory hit: one dict lookup, nothing to parse
+            if cache_key in self._mem:
+                self._mem.move_to_end(cache_key)
+                return self._mem[cache_key]
+
+            # Check if response is already cached on disk
+            row = self._db.execute('SELECT v FROM cache WHERE k=?', (cache_key,)).fetchone()
+            if row is not None:
+                logger.debug("Using cached response for %s", endpoint)
                 try:
-                    with open(cache_path, 'r') as f:
-                        return json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Failed to read cache file {cache_path}: {str(e)}")
+                    data = _json_loads(row[0])
+                except ValueError as e:
+                    logger.warning("Failed to decode cached response for %s: %s", endpoint, e)
                     # If cache is corrupted, continue with the API request
+                else:
+                    self._remember(cache_key, data)
+                    return data
             
             # Make the API request
-            logger.info(f"Making API request to {url}")
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            # Check for API errors
-            if response.status_code == 401:
-                logger.error(f"API key error: {response.text}")
-                raise ApiKeyError("Invalid or missing API key")
-            elif response.status_code == 429:
-                logger.error("API rate limit exceeded")
-                raise ApiRateLimitError("Rate limit exceeded. Please try again later.")
-            elif response.status_code != 200:
-                logger.error(f"API request failed: {response.status_code} - {response.text}")
-                raise RequestException(f"API request failed with status {response.status_code}: {response.text}")
-            
-            # Parse the response
-            data = response.json()
-            
-            # Cache the response
+            logger.info("Making API request to %s", url)
+            response = self._session.get(url, params=params)
+            self._check_status(response)
+
+            # Parse the response from the raw bytes (skips requests' own
+            # stdlib-json decode path)
+            data = _json_loads(response.content)
+
+            # Cache the response; the cache is machine-read only, so it is
+            # written compact rather than pretty-printed
             try:
-                with open(cache_path, 'w') as f:
-                    json.dump(data, f, indent=2)
-                logger.debug(f"Cached response to {cache_path}")
-            except (IOError, OSError) as e:
-                logger.warning(f"Failed to cache response to {cache_path}: {str(e)}")
+                self._db.execute('INSERT OR REPLACE INTO cache(k, v) VALUES(?, ?)',
+                                 (cache_key, _json_dumps(data)))
+                logger.debug("Cached response for %s", endpoint)
+            except sqlite3.Error as e:
+                logger.warning("Failed to cache response for %s: %s", endpoint, e)
                 # Continue even if caching fails
-            
+
+            self._remember(cache_key, data)
             return data
-            
-        except (json.JSONDecodeError, RequestException) as e:
+
+        except (ValueError, RequestException) as e:
             # Re-raise request exceptions
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise
         except Exception as e:
             # Catch any other exceptions and provide context
-            logger.exception(f"Unexpected error in API request: {str(e)}")
+            logger.exception("Unexpected error in API request: %s", e)
+            raise NBAApiException(f"Unexpected error in API request: {str(e)}") from e
+
+    def _request_bytes(self, endpoint: str, params: Optional[Dict] = None) -> bytes:
+        """Make a request to the API and return the raw JSON bytes, with caching.
+
+        Used when the caller validates the payload straight from the bytes
+        (e.g. Pydantic's model_validate_json), which skips materializing the
+        intermediate dict entirely.
+
+        Args:
+            endpoint: API endpoint (e.g., 'players', 'teams')
+            params: Query parameters
+
+        Returns:
+            API response body as bytes
+
+        Raises:
+            ApiKeyError: If the API key is invalid or missing.
+            ApiRateLimitError: If the API rate limit has been reached.
+            RequestException: If the API request fails for other reasons.
+            CacheError: If there's an issue with the cache.
+        """
+        url = _endpoint_url(self.base_url, endpoint)
+        logger.debug("Request: %s, Params: %s", url, params)
+
+        try:
+            cache_key = self._cache_key(endpoint, params)
+
+            # Cached values are the response JSON bytes, so a hit is returned
+            # as-is without any decode step
+            row = self._db.execute('SELECT v FROM cache WHERE k=?', (cache_key,)).fetchone()
+            if row is not None:
+                logger.debug("Using cached response for %s", endpoint)
+                return row[0]
+
+            logger.info("Making API request to %s", url)
+            response = self._session.get(url, params=params)
+            self._check_status(response)
+
+            raw = response.content
+            try:
+                self._db.execute('INSERT OR REPLACE INTO cache(k, v) VALUES(?, ?)',
+                                 (cache_key, raw))
+                logger.debug("Cached response for %s", endpoint)
+            except sqlite3.Error as e:
+                logger.warning("Failed to cache response for %s: %s", endpoint, e)
+                # Continue even if caching fails
+
+            return raw
+
+        except (ValueError, RequestException) as e:
+            # Re-raise request exceptions
+            logger.error("Request error: %s", e)
+            raise
+        except Exception as e:
+            # Catch any other exceptions and provide context
+            logger.exception("Unexpected error in API request: %s", e)
             raise NBAApiException(f"Unexpected error in API request: {str(e)}") from e
 
     def search_players(self, name: str) -> List[Dict]:
@@ -161,41 +375,38 @@ class BallDontLieClient:
             RequestException: If the API request fails for other reasons.
             CacheError: If there's an issue with the cache.
         """
-        logger.info(f"Searching for player: {name}")
+        logger.info("Searching for player: %s", name)
         
         try:
             # Split the name to check if it's a full name
             name_parts = name.strip().split()
             
             if len(name_parts) > 1:
-                # If we have multiple parts, try both approaches
-                
-                # Approach 1: Use the general search parameter
-                params = {"search": name}
-                response1 = self._request("players", params)
-                results1 = response1.get("data", [])
-                
-                # Approach 2: Use specific first_name and last_name parameters
-                # Assuming first part is first name and last part is last name
-                params = {
-                    "first_name": name_parts[0],
-                    "last_name": name_parts[-1]
-                }
-                response2 = self._request("players", params)
-                results2 = response2.get("data", [])
-                
-                # Combine results, removing duplicates based on player ID
-                all_results = results1 + results2
-                unique_results = []
-                seen_ids = set()
-                
-                for player in all_results:
-                    player_id = player.get("id")
-                    if player_id not in seen_ids:
-                        seen_ids.add(player_id)
-                        unique_results.append(player)
-                
-                logger.info(f"Found {len(unique_results)} unique players matching '{name}'")
+                # If we have multiple parts, try both approaches, issuing the
+                # two independent queries concurrently so the search costs one
+                # round-trip instead of two:
+                # 1. the general search parameter, and
+                # 2. specific first_name/last_name parameters (assuming first
+                #    part is first name and last part is last name)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    future1 = executor.submit(self._request, "players", {"search": name})
+                    future2 = executor.submit(self._request, "players", {
+                        "first_name": name_parts[0],
+                        "last_name": name_parts[-1]
+                    })
+                    results1 = future1.result().get("data", [])
+                    results2 = future2.result().get("data", [])
+
+                # Combine results, removing duplicates based on player ID.
+                # A dict keyed by id dedups in one hashed insert per player
+                # and preserves insertion order, so the first occurrence wins
+                # just like the old seen_ids scan did.
+                unique = {}
+                for player in chain(results1, results2):
+                    unique.setdefault(player.get("id"), player)
+                unique_results = list(unique.values())
+
+                logger.info("Found %d unique players matching '%s'", len(unique_results), name)
                 return unique_results
             else:
                 # If only one name part, use the standard search
@@ -203,51 +414,53 @@ class BallDontLieClient:
                 response = self._request("players", params)
                 results = response.get("data", [])
                 
-                logger.info(f"Found {len(results)} players matching '{name}'")
+                logger.info("Found %d players matching '%s'", len(results), name)
                 return results
                 
         except Exception as e:
-            logger.error(f"Error searching for player '{name}': {str(e)}")
+            logger.error("Error searching for player '%s': %s", name, e)
             raise
 
-    def get_player(self, player_id: int) -> Dict:
+    def get_player(self, player_id: int) -> Player:
         """Get detailed information about a specific player.
-        
+
         Args:
             player_id: The player's ID in the BallDontLie API
-                
+
         Returns:
-            Player data dictionary
-            
+            Validated Player model
+
         Raises:
             PlayerNotFoundError: If the player is not found
             ApiKeyError: If the API key is invalid or missing
             ApiRateLimitError: If the API rate limit has been reached
             RequestException: If the API request fails for other reasons
         """
-        logger.info(f"Getting player details for ID: {player_id}")
-        
+        logger.info("Getting player details for ID: %s", player_id)
+
+        # Validate player_id
+        if not isinstance(player_id, int) or player_id <= 0:
+            raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
+
+        raw = self._request_bytes(f"players/{player_id}")
+
+        # Validate straight from the response bytes - pydantic-core
+        # parses the JSON and builds the model in one Rust-side pass,
+        # with no intermediate dict. The API signals an unknown player
+        # with a null, missing or empty "data" object; the empty object
+        # fails Player validation, so it maps to not-found too.
         try:
-            # Validate player_id
-            if not isinstance(player_id, int) or player_id <= 0:
-                raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
-            
-            response = self._request(f"players/{player_id}")
-            player_data = response.get("data", {})
-            
-            if not player_data:
-                logger.error(f"Player not found with ID: {player_id}")
-                raise PlayerNotFoundError(f"Player not found with ID: {player_id}")
-            
-            logger.info(f"Found player: {player_data.get('first_name')} {player_data.get('last_name')}")
-            return player_data
-            
-        except (PlayerNotFoundError, ApiKeyError, ApiRateLimitError, RequestException):
-            # Re-raise known exceptions
-            raise
-        except Exception as e:
-            logger.exception(f"Unexpected error getting player {player_id}: {str(e)}")
-            raise NBAApiException(f"Unexpected error getting player {player_id}: {str(e)}") from e
+            player = _PlayerEnvelope.model_validate_json(raw).data
+        except ValidationError:
+            logger.error("Player not found with ID: %s", player_id)
+            raise PlayerNotFoundError(f"Player not found with ID: {player_id}")
+
+        if player is None:
+            logger.error("Player not found with ID: %s", player_id)
+            raise PlayerNotFoundError(f"Player not found with ID: {player_id}")
+
+        logger.info("Found player: %s %s", player.first_name, player.last_name)
+        return player
 
     def get_player_stats(self, player_id: int, season: Optional[int] = None) -> List[Dict]:
         """Get statistics for a player.
@@ -266,37 +479,75 @@ class BallDontLieClient:
             ApiRateLimitError: If the API rate limit has been reached
             RequestException: If the API request fails for other reasons
         """
-        logger.info(f"Getting stats for player ID: {player_id}, Season: {season}")
-        
-        try:
-            # Validate player_id
-            if not isinstance(player_id, int) or player_id <= 0:
-                raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
-            
-            # Validate season if provided
-            if season is not None:
-                current_year = datetime.now().year
-                if not isinstance(season, int) or season < 1946 or season > current_year:
-                    raise InvalidParameterError(
-                        f"Invalid season: {season}. Must be between 1946 and {current_year}."
-                    )
-            
-            params = {"player_ids[]": player_id}
-            if season:
-                params["seasons[]"] = season
-                
+        logger.info("Getting stats for player ID: %s, Season: %s", player_id, season)
+
+        # Validate player_id
+        if not isinstance(player_id, int) or player_id <= 0:
+            raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
+
+        # Validate season if provided
+        if season is not None:
+            current_year = datetime.now().year
+            if not isinstance(season, int) or season < 1946 or season > current_year:
+                raise InvalidParameterError(
+                    f"Invalid season: {season}. Must be between 1946 and {current_year}."
+                )
+
+        stats = self._get_player_stats_unchecked(player_id, season)
+
+        logger.info("Found %d stat entries for player %s", len(stats), player_id)
+        return stats
+
+    def _get_player_stats_unchecked(self, player_id: int, season: Optional[int] = None) -> List[Dict]:
+        """Fetch a player's stats without re-validating the arguments.
+
+        Callers that have already validated the player id and season (e.g.
+        compare_player_seasons, which checks every season up front) use this
+        to skip the duplicate checks in get_player_stats on the hot path.
+        """
+        params = {"player_ids[]": player_id}
+        if season:
+            params["seasons[]"] = season
+
+        response = self._request("stats", params)
+        return response.get("data", [])
+
+    def _get_stats_for_seasons(self, player_id: int, seasons: List[int]) -> Dict[int, List[Dict]]:
+        """Fetch stats for several seasons with a single paginated API call.
+
+        The /stats endpoint accepts repeated seasons[] params, so one bulk
+        request (following the cursor for large result sets) replaces a
+        round-trip per season; results are grouped by game season locally.
+
+        Args:
+            player_id: The player's ID in the BallDontLie API
+            seasons: Season years to fetch
+
+        Returns:
+            Mapping of season year to that season's stat entries
+        """
+        stats_by_season = {season: [] for season in seasons}
+
+        # The seasons tuple keeps the params hashable for cache keying;
+        # requests serializes it as repeated seasons[] query params
+        params = {
+            "player_ids[]": player_id,
+            "seasons[]": tuple(seasons),
+            "per_page": 100,
+        }
+        while True:
             response = self._request("stats", params)
-            stats = response.get("data", [])
-            
-            logger.info(f"Found {len(stats)} stat entries for player {player_id}")
-            return stats
-            
-        except (PlayerNotFoundError, InvalidParameterError, ApiKeyError, ApiRateLimitError, RequestException):
-            # Re-raise known exceptions
-            raise
-        except Exception as e:
-            logger.exception(f"Unexpected error getting stats for player {player_id}: {str(e)}")
-            raise NBAApiException(f"Unexpected error getting stats for player {player_id}: {str(e)}") from e
+            for stat in response.get("data", []):
+                season = stat.get("game", {}).get("season")
+                if season in stats_by_season:
+                    stats_by_season[season].append(stat)
+
+            next_cursor = response.get("meta", {}).get("next_cursor")
+            if not next_cursor:
+                break
+            params = {**params, "cursor": next_cursor}
+
+        return stats_by_season
 
     def get_player_seasons(self, player_id: int) -> List[int]:
         """Get all seasons a player has played."""
@@ -305,17 +556,17 @@ class BallDontLieClient:
             params = {"player_ids[]": player_id}
             response = self._request("stats", params)
             
-            # Extract unique seasons from the stats data
-            seasons = set()
-            for stat in response.get("data", []):
-                if "game" in stat and "season" in stat["game"]:
-                    seasons.add(stat["game"]["season"])
-            
-            seasons_list = sorted(list(seasons))
-            return seasons_list
+            # Extract unique seasons from the stats data in one comprehension -
+            # a single C-level set build, with the "game" dict looked up once
+            # per entry - and sort the set directly
+            return sorted({
+                game["season"]
+                for stat in response.get("data", ())
+                if (game := stat.get("game")) and "season" in game
+            })
         except Exception as e:
             # Handle exceptions
-            logger.error(f"Error getting seasons for player {player_id}: {str(e)}")
+            logger.error("Error getting seasons for player %s: %s", player_id, e)
             raise
 
     def compare_player_seasons(self, player_id: int, seasons: List[int]) -> Dict:
@@ -347,148 +598,118 @@ class BallDontLieClient:
             ApiRateLimitError: If the API rate limit has been reached
             RequestException: If the API request fails for other reasons
         """
-        logger.info(f"Comparing seasons {seasons} for player ID: {player_id}")
+        logger.info("Comparing seasons %s for player ID: %s", seasons, player_id)
         
-        try:
-            # Validate player_id
-            if not isinstance(player_id, int) or player_id <= 0:
-                raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
-            
-            # Validate seasons
-            if not seasons or not isinstance(seasons, list):
-                raise InvalidParameterError("Seasons must be a non-empty list of integers")
-            
-            current_year = datetime.now().year
-            for season in seasons:
-                if not isinstance(season, int) or season < 1946 or season > current_year:
-                    raise InvalidParameterError(
-                        f"Invalid season: {season}. Must be between 1946 and {current_year}."
-                    )
-            
-            # Get player information
-            player = self.get_player(player_id)
-            
-            # Calculate season averages for each season
-            season_averages_raw = {}
-            for season in seasons:
-                stats = self.get_player_stats(player_id, season)
-                
-                # Skip if no stats found for this season
-                if not stats:
-                    logger.warning(f"No stats found for player {player_id} in season {season}")
-                    season_averages_raw[season] = None
-                    continue
-                
-                # Calculate averages
-                total_games = len(stats)
-                if total_games == 0:
-                    season_averages_raw[season] = None
-                    continue
-                
-                totals = {
-                    "pts": 0, "reb": 0, "ast": 0, "stl": 0, "blk": 0,
-                    "turnover": 0, "fg_pct": 0, "fg3_pct": 0, "ft_pct": 0,
-                    "min": 0, "games_played": total_games
-                }
-                
-                valid_games = 0
-                for game in stats:
-                    valid_game = True
-                    for key in totals.keys():
-                        if key == "games_played":
-                            continue
-                        
-                        if key == "min":
-                            # Handle minutes played (format like "34:56")
-                            min_str = game.get(key, "0:0")
-                            try:
-                                if ":" in min_str:
-                                    minutes, seconds = min_str.split(":")
-                                    totals[key] += int(minutes) + (int(seconds) / 60)
-                                else:
-                                    # Handle cases where minutes might be a straight number
-                                    totals[key] += float(min_str)
-                            except (ValueError, TypeError):
-                                valid_game = False
-                                break
-                        else:
-                            # Handle regular numerical stats
-                            try:
-                                value = game.get(key, 0)
-                                if value is not None:
-                                    totals[key] += float(value)
-                            except (ValueError, TypeError):
-                                valid_game = False
-                                break
-                    
-                    if valid_game:
-                        valid_games += 1
-                
-                # Calculate averages
-                if valid_games > 0:
-                    averages = {k: v / valid_games for k, v in totals.items() if k != "games_played"}
-                    averages["games_played"] = total_games
-                    season_averages_raw[season] = averages
-                else:
-                    season_averages_raw[season] = None
-            
-            # Convert integer season keys to strings for JSON compatibility
-            season_averages = {str(season): stats for season, stats in season_averages_raw.items()}
-            
-            # Calculate growth between consecutive seasons
-            growth = {}
-            key_metrics = ["pts", "reb", "ast", "stl", "blk", "fg_pct", "fg3_pct", "ft_pct"]
-            
+        # Validate player_id
+        if not isinstance(player_id, int) or player_id <= 0:
+            raise InvalidParameterError(f"Invalid player ID: {player_id}. Must be a positive integer.")
+
+        # Validate seasons - the year is read once and a generator scan
+        # short-circuits on the first bad value, so the whole check runs
+        # before any network I/O with constant Python overhead
+        if not seasons or not isinstance(seasons, list):
+            raise InvalidParameterError("Seasons must be a non-empty list of integers")
+
+        current_year = datetime.now().year
+        bad_season = next(
+            (s for s in seasons if not isinstance(s, int) or not 1946 <= s <= current_year),
+            None
+        )
+        if bad_season is not None:
+            raise InvalidParameterError(
+                f"Invalid season: {bad_season}. Must be between 1946 and {current_year}."
+            )
+
+        # Get player information
+        player = self.get_player(player_id)
+
+        # Fetch every season with one bulk /stats request (the API takes
+        # repeated seasons[] params) and group locally - a single round-trip
+        # regardless of how many seasons are compared
+        stats_by_season = self._get_stats_for_seasons(player_id, seasons)
+
+        # Calculate season averages for each season, keyed by the integer
+        # season year - orjson serializes non-string keys directly, so
+        # there is no str()/int() round-trip at the JSON boundary
+        season_averages = {}
+        for season in seasons:
+            stats = stats_by_season[season]
+
+            # Skip if no stats found for this season
+            if not stats:
+                logger.warning("No stats found for player %s in season %s", player_id, season)
+                season_averages[season] = None
+                continue
+
+            total_games = len(stats)
+
+            # Extract each stat into a float64 matrix once and average in
+            # C instead of looping games x keys in Python. Missing or
+            # malformed values become NaN and drop out of the mean per
+            # column rather than discarding the whole game. Minutes get
+            # their own column since the API reports them as "MM:SS".
+            arr = np.array(
+                [[_stat_value(game.get(col)) for col in _STAT_KEYS] for game in stats],
+                dtype=np.float64,
+            )
+            mins = np.array([_parse_minutes(game.get("min", "0:0")) for game in stats],
+                            dtype=np.float64)
+
+            valid_counts = np.count_nonzero(~np.isnan(arr), axis=0)
+            col_means = np.where(
+                valid_counts > 0,
+                np.nansum(arr, axis=0) / np.maximum(valid_counts, 1),
+                0.0,
+            )
+            min_valid = np.count_nonzero(~np.isnan(mins))
+            min_mean = float(np.nansum(mins) / min_valid) if min_valid else 0.0
+
+            averages = dict(zip(_STAT_KEYS, col_means.tolist()))
+            averages["min"] = min_mean
+            averages["games_played"] = total_games
+            season_averages[season] = averages
+
+        # Calculate growth between consecutive seasons as one vectorized
+        # pct-change over an (n_seasons, n_metrics) matrix instead of a
+        # nested Python loop. Zero baselines stay NaN - the SeasonGrowth
+        # serializer turns them into JSON null - and pairs with a missing
+        # season are skipped.
+        growth = {}
+        if len(seasons) > 1:
+            matrix = np.array(
+                [[sa[m] for m in _GROWTH_METRICS] if (sa := season_averages.get(s))
+                 else [np.nan] * len(_GROWTH_METRICS)
+                 for s in seasons],
+                dtype=np.float64,
+            )
+            prev = matrix[:-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = np.where(prev != 0, (matrix[1:] - prev) / np.abs(prev) * 100, np.nan).round(1)
+
             for i in range(1, len(seasons)):
-                prev_season = seasons[i-1]
-                curr_season = seasons[i]
-                
-                prev_stats = season_averages_raw.get(prev_season)
-                curr_stats = season_averages_raw.get(curr_season)
-                
                 # Skip if either season has no stats
-                if not prev_stats or not curr_stats:
+                if not season_averages.get(seasons[i-1]) or not season_averages.get(seasons[i]):
                     continue
-                
-                # Calculate percentage changes
-                season_growth = {}
-                for metric in key_metrics:
-                    prev_value = prev_stats.get(metric, 0)
-                    curr_value = curr_stats.get(metric, 0)
-                    
-                    # Avoid division by zero
-                    if prev_value and prev_value != 0:
-                        pct_change = ((curr_value - prev_value) / abs(prev_value)) * 100
-                        season_growth[metric] = round(pct_change, 1)
-                    else:
-                        season_growth[metric] = None
-                
-                # Store growth data for this season pair
-                growth[f"{prev_season}-{curr_season}"] = season_growth
-            
-            # Prepare the final result
-            result = {
-                "player": {
-                    "id": player.get("id"),
-                    "name": f"{player.get('first_name')} {player.get('last_name')}",
-                    "team": player.get("team", {}).get("full_name")
-                },
-                "seasons": seasons,
-                "season_averages": season_averages,
-                "growth": growth,
-                "metrics": key_metrics
-            }
-            
-            logger.info(f"Successfully compared {len(seasons)} seasons for player {player_id}")
-            return result
-            
-        except (PlayerNotFoundError, InvalidParameterError, ApiKeyError, ApiRateLimitError, RequestException):
-            # Re-raise known exceptions
-            raise
-        except Exception as e:
-            logger.exception(f"Unexpected error comparing seasons for player {player_id}: {str(e)}")
-            raise NBAApiException(f"Unexpected error comparing seasons for player {player_id}: {str(e)}") from e
-        
+                growth[f"{seasons[i-1]}-{seasons[i]}"] = dict(
+                    zip(_GROWTH_METRICS, pct[i-1].tolist())
+                )
+
+        # Prepare the final result
+        result = {
+            "player": {
+                "id": player.id,
+                "name": player.full_name,
+                "team": player.team.full_name if player.team else None
+            },
+            "seasons": seasons,
+            "season_averages": season_averages,
+            "growth": growth,
+            "metrics": list(_GROWTH_METRICS)
+        }
+
+        logger.info("Successfully compared %d seasons for player %s", len(seasons), player_id)
+        return result
+
 
     def format_game_for_calendar(self, game: Dict) -> Dict:
         """Format a game for calendar display.
@@ -1,23 +1,64 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
-# Create logs directory if it doesn't exist
-os.makedirs("logs", exist_ok=True)
+# Logging is configured lazily, once per process. Doing it at import time
+# opened the log file for every worker that imported the package, and
+# basicConfig with explicit handlers is silently ignored if logging was
+# already configured - leaking a file descriptor per worker in a pre-fork
+# server setup.
+_configured = False
+_listener = None
 
-# Generate a filename with the current date
-log_filename = f"logs/nba_api_{datetime.now().strftime('%Y-%m-%d')}.log"
+def _configure():
+    """Configure logging once for this process.
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
-    ]
-)
+    Log records are routed through a queue: callers only enqueue the record
+    (an atomic put), and a background listener thread does the formatting
+    and file/console I/O. Hot-path log calls therefore never block on a
+    file lock or disk write.
+    """
+    global _configured, _listener
+    if _configured:
+        return
+
+    # Create logs directory if it doesn't exist
+    os.makedirs("logs", exist_ok=True)
+
+    # Generate a filename with the current date
+    log_filename = f"logs/nba_api_{datetime.now().strftime('%Y-%m-%d')}.log"
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_filename)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    # Drain the queue on interpreter exit - the listener thread is a
+    # daemon, so without this any still-queued records would be dropped
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+
+    # Give the package logger the queue handler directly and stop propagation
+    # there, so records aren't emitted twice when an embedding application
+    # installs its own handlers on the root logger.
+    package_logger = logging.getLogger('nba_api')
+    package_logger.propagate = False
+    package_logger.addHandler(queue_handler)
+
+    _configured = True
 
 def get_logger(name):
     """Get a logger with the specified name."""
-    return logging.getLogger(name)
\ No newline at end of file
+    _configure()
+    return logging.getLogger(name)
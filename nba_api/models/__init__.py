@@ -1,9 +1,13 @@
 from .player import Team, Player, PlayerBase, PlayerStat, PlayerWithStats, SearchResponse
 from .calendar import GameEvent, CalendarEventResponse, CalendarAuthStatusResponse
-from .stats import SeasonStat, PlayerSummary, SeasonGrowth, StatisticsComparison, StatisticsRequest
+from .stats import (
+    SeasonStat, PlayerSummary, SeasonGrowth, StatisticsComparison,
+    StatisticsComparisonSoA, StatisticsRequest, SeasonStatRow, SeasonGrowthRow
+)
 
 __all__ = [
     "Team", "Player", "PlayerBase", "PlayerStat", "PlayerWithStats", "SearchResponse",
     "GameEvent", "CalendarEventResponse", "CalendarAuthStatusResponse",
-    "SeasonStat", "PlayerSummary", "SeasonGrowth", "StatisticsComparison", "StatisticsRequest"
-]
\ No newline at end of file
+    "SeasonStat", "PlayerSummary", "SeasonGrowth", "StatisticsComparison",
+    "StatisticsComparisonSoA", "StatisticsRequest", "SeasonStatRow", "SeasonGrowthRow"
+]
@@ -1,45 +1,311 @@
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+import math
+import operator
+from dataclasses import dataclass
+from typing import Annotated, Dict, List, Optional, Any, Union
+
+import numpy as np
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_serializer
+)
+
+from nba_api._cext import growth_pct_f32
+
+# Metric fields carried by SeasonGrowth, in declaration order. Kept at
+# module scope so array-based constructors can zip against it without
+# rebuilding the tuple per call.
+_METRIC_NAMES = ('pts', 'reb', 'ast', 'stl', 'blk', 'fg_pct', 'fg3_pct', 'ft_pct')
+
+# SeasonStat fields in declaration order plus a bound itemgetter: one
+# C-level call pulls all eleven values from a raw row instead of eleven
+# separate dict lookups.
+_SEASONSTAT_FIELDS = ('pts', 'reb', 'ast', 'stl', 'blk', 'turnover',
+                      'fg_pct', 'fg3_pct', 'ft_pct', 'min', 'games_played')
+_SEASONSTAT_GETTER = operator.itemgetter(*_SEASONSTAT_FIELDS)
+
+# Shared config for the hot response models: frozen instances hash/share
+# safely across cache layers, extra='ignore' skips the unknown-key check,
+# and revalidate_instances='never' stops pydantic re-running validators on
+# already-built models when they are nested into a parent.
+_FAST_CONFIG = ConfigDict(
+    frozen=True,
+    extra='ignore',
+    arbitrary_types_allowed=False,
+    revalidate_instances='never',
+    populate_by_name=False,
+)
 
 class SeasonStat(BaseModel):
-    """Statistics for a single season."""
-    pts: float = Field(..., description="Points per game")
-    reb: float = Field(..., description="Rebounds per game")
-    ast: float = Field(..., description="Assists per game")
-    stl: float = Field(..., description="Steals per game")
-    blk: float = Field(..., description="Blocks per game")
-    turnover: float = Field(..., description="Turnovers per game")
-    fg_pct: float = Field(..., description="Field goal percentage")
-    fg3_pct: float = Field(..., description="3-point percentage")
-    ft_pct: float = Field(..., description="Free throw percentage")
-    min: float = Field(..., description="Minutes played per game")
-    games_played: int = Field(..., description="Number of games played")
+    """Per-game statistics averaged over a single season.
+
+    Fields: points (pts), rebounds (reb), assists (ast), steals (stl),
+    blocks (blk), turnovers (turnover), shooting percentages (fg_pct,
+    fg3_pct, ft_pct), minutes per game (min) and games_played.
+    """
+    model_config = _FAST_CONFIG
+
+    pts: float
+    reb: float
+    ast: float
+    stl: float
+    blk: float
+    turnover: float
+    fg_pct: float
+    fg3_pct: float
+    ft_pct: float
+    min: float
+    games_played: Annotated[int, Field(ge=0)]
+
+    @classmethod
+    def from_row(cls, data: Dict[str, Any]) -> "SeasonStat":
+        """Build from a trusted raw row, skipping validation.
+
+        Meant for bulk rebuilds from dumps this service wrote itself
+        (load_from_json round-trips); the itemgetter fetches all eleven
+        fields in one C-level call and model_construct bypasses the
+        validator chain.
+        """
+        return cls.model_construct(
+            **dict(zip(_SEASONSTAT_FIELDS, _SEASONSTAT_GETTER(data)))
+        )
 
 class PlayerSummary(BaseModel):
-    """Summary information about a player."""
-    id: int = Field(..., description="Player ID")
-    name: str = Field(..., description="Player's full name")
-    team: Optional[str] = Field(None, description="Player's current team")
+    """Summary information about a player: id, full name and team."""
+    model_config = _FAST_CONFIG
+
+    id: int
+    name: str
+    team: Optional[str] = None
 
 class SeasonGrowth(BaseModel):
-    """Growth/decline between seasons for various metrics."""
-    pts: Optional[float] = Field(None, description="Points growth percentage")
-    reb: Optional[float] = Field(None, description="Rebounds growth percentage")
-    ast: Optional[float] = Field(None, description="Assists growth percentage")
-    stl: Optional[float] = Field(None, description="Steals growth percentage")
-    blk: Optional[float] = Field(None, description="Blocks growth percentage")
-    fg_pct: Optional[float] = Field(None, description="Field goal percentage growth")
-    fg3_pct: Optional[float] = Field(None, description="3-point percentage growth")
-    ft_pct: Optional[float] = Field(None, description="Free throw percentage growth")
+    """Growth/decline percentage between seasons for each metric.
+
+    Missing values are NaN internally rather than None - arithmetic over
+    the fields stays branchless and NumPy-friendly - and are re-emitted
+    as JSON null at serialization time.
+    """
+    model_config = _FAST_CONFIG
+
+    pts: float = math.nan
+    reb: float = math.nan
+    ast: float = math.nan
+    stl: float = math.nan
+    blk: float = math.nan
+    fg_pct: float = math.nan
+    fg3_pct: float = math.nan
+    ft_pct: float = math.nan
+
+    @field_validator('*', mode='before')
+    @classmethod
+    def _none_to_nan(cls, value):
+        # Accept null from round-tripped JSON (orjson writes NaN as null)
+        return math.nan if value is None else value
+
+    @model_serializer
+    def _nan_to_none(self) -> Dict[str, Optional[float]]:
+        # Map the NaN sentinel back to None so JSON output carries null
+        return {
+            name: None if math.isnan(value) else value
+            for name, value in ((n, getattr(self, n)) for n in _METRIC_NAMES)
+        }
+
+    @classmethod
+    def from_arrays(cls, prev: np.ndarray, curr: np.ndarray) -> "SeasonGrowth":
+        """Build growth percentages from two aligned metric vectors.
+
+        ``prev`` and ``curr`` hold the eight metrics of ``_METRIC_NAMES``
+        in order; the percent change for all of them is computed in one
+        vectorized pass instead of eight Python arithmetic ops. Zero (or
+        NaN) baselines stay NaN. The inputs are trusted arrays the service
+        built itself, so the instance is assembled with model_construct
+        rather than re-validated.
+        """
+        if growth_pct_f32 is not None:
+            # For a single 8-metric pair NumPy's dispatch overhead swamps
+            # the arithmetic; the C kernel does the whole vector in one call
+            growth = growth_pct_f32(prev, curr).astype(np.float64)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                growth = np.where(prev != 0, (curr - prev) / np.abs(prev) * 100.0, np.nan)
+        return cls.model_construct(**dict(zip(_METRIC_NAMES, growth.round(1).tolist())))
 
 class StatisticsComparison(BaseModel):
     """Complete comparison of player statistics across seasons."""
-    player: PlayerSummary = Field(..., description="Player information")
-    seasons: List[int] = Field(..., description="Seasons included in the comparison")
-    season_averages: Dict[str, Optional[Dict[str, Any]]] = Field(..., description="Statistics by season")
-    growth: Dict[str, Optional[SeasonGrowth]] = Field(..., description="Growth between seasons")
-    metrics: List[str] = Field(..., description="Metrics included in the comparison")
+    model_config = _FAST_CONFIG
+
+    player: PlayerSummary
+    seasons: List[int]
+    # Keyed by the integer season year - orjson handles non-string keys
+    # at the JSON boundary, so nothing stringifies/re-parses the year
+    season_averages: Dict[int, Optional[Dict[str, Any]]]
+    growth: Dict[str, Optional[SeasonGrowth]]
+    metrics: List[str]
+
+    @classmethod
+    def validate_many(cls, rows: List[Any]) -> List["StatisticsComparison"]:
+        """Validate a batch of comparisons in one pydantic-core call.
+
+        Delegates to a module-level TypeAdapter so the core schema is built
+        once at import and the dispatch cost is amortized across the whole
+        batch instead of paid per row.
+        """
+        return _COMPARISON_LIST_ADAPTER.validate_python(rows)
+
+class StatisticsComparisonSoA(BaseModel):
+    """Structure-of-arrays counterpart of StatisticsComparison.
+
+    Instead of one dict per season (an array-of-structs layout that boxes
+    every metric as a separate Python float), the per-season averages live
+    in a single contiguous (num_seasons, num_metrics) float64 matrix with
+    a parallel column-name tuple. Internal computations (growth, z-scores)
+    slice ``matrix`` directly; the dict-of-dicts shape the HTTP layer
+    serializes is only materialized on demand via ``to_aos``. Seasons with
+    no data are all-NaN rows.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    player: PlayerSummary
+    seasons: List[int]
+    metrics: tuple
+    matrix: np.ndarray
+
+    def column(self, metric: str) -> np.ndarray:
+        """One metric across all seasons, as a contiguous view."""
+        return self.matrix[:, self.metrics.index(metric)]
+
+    def to_aos(self) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Materialize the per-season dict-of-dicts view.
+
+        Matches the ``season_averages`` shape of StatisticsComparison:
+        integer season keys, None for seasons with no data.
+        """
+        out: Dict[int, Optional[Dict[str, Any]]] = {}
+        for season, row in zip(self.seasons, self.matrix):
+            if np.isnan(row).all():
+                out[season] = None
+            else:
+                out[season] = dict(zip(self.metrics, row.tolist()))
+        return out
 
 class StatisticsRequest(BaseModel):
     """Request model for statistics comparison."""
-    seasons: List[int] = Field(..., description="Seasons to compare")
\ No newline at end of file
+    seasons: List[int]
+
+# Field documentation, kept out of the model definitions so the core
+# schemas stay lean (no per-field FieldInfo with embedded strings) and
+# cold import / TypeAdapter builds are cheaper. Anything generating
+# user-facing docs can pull from here instead.
+FIELD_DOCS: Dict[str, Dict[str, str]] = {
+    'SeasonStat': {
+        'pts': "Points per game",
+        'reb': "Rebounds per game",
+        'ast': "Assists per game",
+        'stl': "Steals per game",
+        'blk': "Blocks per game",
+        'turnover': "Turnovers per game",
+        'fg_pct': "Field goal percentage",
+        'fg3_pct': "3-point percentage",
+        'ft_pct': "Free throw percentage",
+        'min': "Minutes played per game",
+        'games_played': "Number of games played",
+    },
+    'PlayerSummary': {
+        'id': "Player ID",
+        'name': "Player's full name",
+        'team': "Player's current team",
+    },
+    'SeasonGrowth': {
+        'pts': "Points growth percentage",
+        'reb': "Rebounds growth percentage",
+        'ast': "Assists growth percentage",
+        'stl': "Steals growth percentage",
+        'blk': "Blocks growth percentage",
+        'fg_pct': "Field goal percentage growth",
+        'fg3_pct': "3-point percentage growth",
+        'ft_pct': "Free throw percentage growth",
+    },
+    'StatisticsComparison': {
+        'player': "Player information",
+        'seasons': "Seasons included in the comparison",
+        'season_averages': "Statistics by season",
+        'growth': "Growth between seasons",
+        'metrics': "Metrics included in the comparison",
+    },
+    'StatisticsRequest': {
+        'seasons': "Seasons to compare",
+    },
+}
+
+# Reusable batch validator, built once at import time - constructing a
+# TypeAdapter per call would rebuild the core schema every time
+_COMPARISON_LIST_ADAPTER = TypeAdapter(List[StatisticsComparison])
+
+# Data loaded back from files this service wrote itself (utils.save_to_json)
+# was already validated before it hit disk. With TRUST_CACHE on, fast_build
+# skips re-validation for those round-trips.
+TRUST_CACHE = True
+
+def fast_build(model_cls, data: Dict[str, Any]):
+    """Build a model instance from trusted data, skipping validation.
+
+    model_construct bypasses the whole pydantic-core validator chain, which
+    is an order of magnitude cheaper than the validating constructor. Only
+    use this for data the service serialized itself - fields are assigned
+    exactly as given. Falls back to the validating constructor when
+    TRUST_CACHE is off.
+    """
+    if TRUST_CACHE:
+        return model_cls.model_construct(**data)
+    return model_cls(**data)
+
+# Slotted dataclass counterparts for hot internal paths. The BaseModel
+# variants above validate at the HTTP boundary; when rows are built in bulk
+# from already-trusted API data, these skip the per-field validator chain
+# entirely and, with slots, drop the per-instance __dict__ - roughly half
+# the memory per object.
+
+@dataclass(slots=True, frozen=True)
+class SeasonStatRow:
+    """Unvalidated internal counterpart of SeasonStat."""
+    pts: float
+    reb: float
+    ast: float
+    stl: float
+    blk: float
+    turnover: float
+    fg_pct: float
+    fg3_pct: float
+    ft_pct: float
+    min: float
+    games_played: int
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any]) -> "SeasonStatRow":
+        """Build a row straight from a mapping, with no validation."""
+        return cls(**data)
+
+    @classmethod
+    def from_row(cls, data: Dict[str, Any]) -> "SeasonStatRow":
+        """Build a row positionally via one itemgetter call.
+
+        Faster than from_mapping for bulk loads: all eleven lookups
+        happen in a single C-level call and the values splat straight
+        into the positional constructor.
+        """
+        return cls(*_SEASONSTAT_GETTER(data))
+
+@dataclass(slots=True, frozen=True)
+class SeasonGrowthRow:
+    """Unvalidated internal counterpart of SeasonGrowth."""
+    pts: Optional[float] = None
+    reb: Optional[float] = None
+    ast: Optional[float] = None
+    stl: Optional[float] = None
+    blk: Optional[float] = None
+    fg_pct: Optional[float] = None
+    fg3_pct: Optional[float] = None
+    ft_pct: Optional[float] = None
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any]) -> "SeasonGrowthRow":
+        """Build a row straight from a mapping, with no validation."""
+        return cls(**data)
\ No newline at end of file